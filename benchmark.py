@@ -0,0 +1,107 @@
+"""
+Dense vs sparse-input MLP benchmark: training samples/sec and single-position inference latency.
+
+Usage:
+  .venv/bin/python benchmark.py --positions 20000 --epochs 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import chess
+import numpy as np
+
+import config
+from encoder import encode_board, encode_board_indices
+from train import dense_batches, sparse_batches, to_feature_lists
+
+
+def random_boards(count: int, seed: int = 0) -> list[chess.Board]:
+    rng = random.Random(seed)
+    boards = []
+    while len(boards) < count:
+        board = chess.Board()
+        for _ in range(rng.randint(0, 80)):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            board.push(rng.choice(moves))
+        boards.append(board)
+    return boards
+
+
+def bench_training(model, batches, epochs: int, num_samples: int) -> float:
+    import torch
+
+    criterion = torch.nn.MSELoss()
+    optimizer = torch.optim.Adam(model.parameters(), lr=config.LEARNING_RATE)
+    model.train()
+    start = time.perf_counter()
+    for _ in range(epochs):
+        for inputs, yb in batches():
+            optimizer.zero_grad()
+            loss = criterion(model(*inputs), yb)
+            loss.backward()
+            optimizer.step()
+    return epochs * num_samples / (time.perf_counter() - start)
+
+
+def bench_inference(forward, boards: list[chess.Board]) -> float:
+    import torch
+
+    with torch.no_grad():
+        start = time.perf_counter()
+        for board in boards:
+            forward(board).item()
+    return (time.perf_counter() - start) / len(boards) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dense vs sparse-input MLP evaluators.")
+    parser.add_argument("--positions", type=int, default=20000, help="Random positions to train on.")
+    parser.add_argument("--epochs", type=int, default=2, help="Training epochs per model.")
+    parser.add_argument("--inference-positions", type=int, default=2000, help="Positions for latency timing.")
+    args = parser.parse_args()
+
+    import torch
+    from model import ChessEvaluatorMLP, SparseChessEvaluatorMLP
+
+    torch.set_num_threads(1)
+    boards = random_boards(args.positions)
+    X = np.stack([encode_board(b) for b in boards])
+    y = torch.tensor(np.random.default_rng(0).uniform(-1, 1, len(X)), dtype=torch.float32).unsqueeze(1)
+    X_t = torch.from_numpy(X)
+    indices, offsets = (torch.from_numpy(a) for a in to_feature_lists(X))
+
+    dense, sparse = ChessEvaluatorMLP(), SparseChessEvaluatorMLP()
+    sparse.load_state_dict(dense.state_dict())
+    with torch.no_grad():
+        diff = (dense(X_t[:256]) - sparse(indices[: offsets[256]], offsets[:256])).abs().max().item()
+    print(f"Max |dense - sparse| on shared weights: {diff:.2e}")
+
+    dense_sps = bench_training(
+        dense, lambda: dense_batches(X_t, y, config.BATCH_SIZE, shuffle=True), args.epochs, len(X)
+    )
+    sparse_sps = bench_training(
+        sparse, lambda: sparse_batches(indices, offsets, y, config.BATCH_SIZE, shuffle=True), args.epochs, len(X)
+    )
+    print(f"Training  dense: {dense_sps:10.0f} samples/s")
+    print(f"Training sparse: {sparse_sps:10.0f} samples/s  ({sparse_sps / dense_sps:.2f}x)")
+
+    dense.eval()
+    sparse.eval()
+    single = torch.zeros(1, dtype=torch.long)
+    eval_boards = boards[: args.inference_positions]
+    dense_us = bench_inference(
+        lambda b: dense(torch.tensor(encode_board(b), dtype=torch.float32).unsqueeze(0)), eval_boards
+    )
+    sparse_us = bench_inference(lambda b: sparse(torch.as_tensor(encode_board_indices(b)), single), eval_boards)
+    print(f"Inference  dense: {dense_us:8.1f} us/position (encode + forward)")
+    print(f"Inference sparse: {sparse_us:8.1f} us/position (encode + forward, {dense_us / sparse_us:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Configuration for the chess engine (search/training/randomization).
 import os
 
 EVALUATION_MODE = os.getenv("EVALUATION_MODE", "SIMPLE")  # SIMPLE | CUSTOM_NN
+SPARSE_INPUT = os.getenv("SPARSE_INPUT", "0") == "1"  # feed active-feature indices to the MLP
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 MODELS_DIR = os.path.join(BASE_DIR, "models")
@@ -22,6 +22,15 @@ def encode_board(board: chess.Board) -> np.ndarray:
     return tensor
 
 
+def encode_board_indices(board: chess.Board) -> np.ndarray:
+    """Active feature indices of `encode_board` (at most 32 instead of 768 floats)."""
+    indices = [
+        (0 if piece.color == chess.WHITE else 384) + (piece.piece_type - 1) * 64 + square
+        for square, piece in board.piece_map().items()
+    ]
+    return np.array(sorted(indices), dtype=np.int64)
+
+
 def encode_fen(fen: str) -> np.ndarray:
     board = chess.Board(fen)
     return encode_board(board)
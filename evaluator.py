@@ -4,7 +4,7 @@ Evaluation strategies for chess positions.
 
 import chess
 import config
-from encoder import encode_board
+from encoder import encode_board, encode_board_indices
 
 
 class SimpleEvaluator:
@@ -114,7 +114,7 @@ class CustomNNEvaluator:
 
         self.torch = torch
         self.device = torch.device("mps" if torch.backends.mps.is_available() else "cpu")
-        from model import ChessEvaluatorMLP
+        from model import ChessEvaluatorMLP, SparseChessEvaluatorMLP
 
         try:
             checkpoint = torch.load(config.CUSTOM_MODEL_PATH, map_location=self.device)
@@ -122,16 +122,23 @@ class CustomNNEvaluator:
             raise RuntimeError(
                 f"Model file not found at {config.CUSTOM_MODEL_PATH}. Train it via train.py first."
             ) from exc
-        self.model = ChessEvaluatorMLP().to(self.device)
+        self.sparse = config.SPARSE_INPUT
+        model_cls = SparseChessEvaluatorMLP if self.sparse else ChessEvaluatorMLP
+        self.model = model_cls().to(self.device)
+        self.offsets = torch.zeros(1, dtype=torch.long, device=self.device)
         state_dict = checkpoint["state_dict"] if isinstance(checkpoint, dict) else checkpoint
         self.model.load_state_dict(state_dict)
         self.model.eval()
 
     def evaluate(self, board: chess.Board) -> float:
-        tensor = encode_board(board)
-        x = self.torch.tensor(tensor, dtype=self.torch.float32, device=self.device).unsqueeze(0)
         with self.torch.no_grad():
-            out = self.model(x)
+            if self.sparse:
+                indices = self.torch.as_tensor(encode_board_indices(board), device=self.device)
+                out = self.model(indices, self.offsets)
+            else:
+                tensor = encode_board(board)
+                x = self.torch.tensor(tensor, dtype=self.torch.float32, device=self.device).unsqueeze(0)
+                out = self.model(x)
         # Map tanh output [-1,1] to a rough pawn-scale for search stability.
         return float(out.item() * 4.0)
 
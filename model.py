@@ -1,10 +1,11 @@
 """
-MLP model for chess position evaluation.
+MLP models for chess position evaluation (dense and sparse-input variants).
 """
 
 try:
     import torch
     import torch.nn as nn
+    import torch.nn.functional as F
 except ImportError as exc:
     raise ImportError("PyTorch is required to use model.py") from exc
 
@@ -28,3 +29,56 @@ class ChessEvaluatorMLP(nn.Module):
 
     def count_parameters(self) -> int:
         return sum(p.numel() for p in self.parameters() if p.requires_grad)
+
+
+class SparseChessEvaluatorMLP(nn.Module):
+    """Same network as ChessEvaluatorMLP, but fed active feature indices.
+
+    The first layer is an EmbeddingBag-style sum over the rows of the
+    768x256 weight picked by the (at most 32) active features, instead of a
+    dense matmul over a ~96% zero input. `state_dict()`/`load_state_dict()`
+    use the dense layout, so `m-chess.pth` is interchangeable between both.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        dense = nn.Linear(768, 256)
+        # Stored transposed (one row per feature) so embedding_bag can gather rows.
+        self.input_weight = nn.Parameter(dense.weight.detach().t().contiguous())
+        self.input_bias = nn.Parameter(dense.bias.detach().clone())
+        # Identity keeps the dense indices (layers.2, layers.4) for the remaining layers.
+        self.layers = nn.Sequential(
+            nn.Identity(),
+            nn.ReLU(),
+            nn.Linear(256, 64),
+            nn.ReLU(),
+            nn.Linear(64, 1),
+            nn.Tanh(),
+        )
+
+    def forward(self, indices, offsets):
+        """`indices` is a flat LongTensor of active features, `offsets` the start of each position."""
+        hidden = F.embedding_bag(indices, self.input_weight, offsets, mode="sum") + self.input_bias
+        return self.layers(hidden)
+
+    def count_parameters(self) -> int:
+        return sum(p.numel() for p in self.parameters() if p.requires_grad)
+
+    def _save_to_state_dict(self, destination, prefix, keep_vars):
+        weight, bias = self.input_weight, self.input_bias
+        if not keep_vars:
+            weight, bias = weight.detach(), bias.detach()
+        destination[prefix + "layers.0.weight"] = weight.t()
+        destination[prefix + "layers.0.bias"] = bias
+
+    def _load_from_state_dict(
+        self, state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys, error_msgs
+    ):
+        weight_key, bias_key = prefix + "layers.0.weight", prefix + "layers.0.bias"
+        if weight_key in state_dict:
+            state_dict[prefix + "input_weight"] = state_dict.pop(weight_key).t()
+        if bias_key in state_dict:
+            state_dict[prefix + "input_bias"] = state_dict.pop(bias_key)
+        super()._load_from_state_dict(
+            state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys, error_msgs
+        )
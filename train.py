@@ -25,25 +25,71 @@ def load_data():
     return X[:split_idx], y[:split_idx], X[split_idx:], y[split_idx:]
 
 
+def to_feature_lists(X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Convert dense one-hot rows to (flat active indices, per-row offsets of length N+1)."""
+    rows, cols = np.nonzero(X)
+    offsets = np.zeros(len(X) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=len(X)), out=offsets[1:])
+    return cols.astype(np.int64), offsets
+
+
+def sparse_batches(indices, offsets, y, batch_size: int, shuffle: bool):
+    """Yield `((indices, offsets), y)` batches for SparseChessEvaluatorMLP from feature lists."""
+    import torch
+
+    n = len(offsets) - 1
+    order = torch.randperm(n) if shuffle else torch.arange(n)
+    for start in range(0, n, batch_size):
+        rows = order[start : start + batch_size]
+        begins = offsets[rows]
+        counts = offsets[rows + 1] - begins
+        batch_offsets = torch.zeros_like(counts)
+        torch.cumsum(counts[:-1], dim=0, out=batch_offsets[1:])
+        gather = torch.repeat_interleave(begins - batch_offsets, counts) + torch.arange(int(counts.sum()))
+        yield (indices[gather], batch_offsets), y[rows]
+
+
+def dense_batches(X, y, batch_size: int, shuffle: bool):
+    """Yield `((X,), y)` batches for ChessEvaluatorMLP."""
+    from torch.utils.data import TensorDataset, DataLoader
+
+    for xb, yb in DataLoader(TensorDataset(X, y), batch_size=batch_size, shuffle=shuffle):
+        yield (xb,), yb
+
+
 def train():
     _lazy_imports()
     import torch
     import torch.nn as nn
     import torch.optim as optim
-    from torch.utils.data import TensorDataset, DataLoader
     from tqdm import tqdm
-    from model import ChessEvaluatorMLP
+    from model import ChessEvaluatorMLP, SparseChessEvaluatorMLP
 
     device = torch.device("mps" if torch.backends.mps.is_available() else "cpu")
     X_train, y_train, X_val, y_val = load_data()
 
-    X_train_t = torch.tensor(X_train, dtype=torch.float32)
     y_train_t = torch.tensor(y_train, dtype=torch.float32).unsqueeze(1)
-    X_val_t = torch.tensor(X_val, dtype=torch.float32)
     y_val_t = torch.tensor(y_val, dtype=torch.float32).unsqueeze(1)
 
-    train_loader = DataLoader(TensorDataset(X_train_t, y_train_t), batch_size=config.BATCH_SIZE, shuffle=True)
-    model = ChessEvaluatorMLP().to(device)
+    if config.SPARSE_INPUT:
+        train_idx, train_off = (torch.from_numpy(a) for a in to_feature_lists(X_train))
+        val_idx, val_off = (torch.from_numpy(a) for a in to_feature_lists(X_val))
+        val_inputs = (val_idx, val_off[:-1])
+
+        def train_loader():
+            return sparse_batches(train_idx, train_off, y_train_t, config.BATCH_SIZE, shuffle=True)
+
+        model = SparseChessEvaluatorMLP().to(device)
+    else:
+        X_train_t = torch.tensor(X_train, dtype=torch.float32)
+        val_inputs = (torch.tensor(X_val, dtype=torch.float32),)
+
+        def train_loader():
+            return dense_batches(X_train_t, y_train_t, config.BATCH_SIZE, shuffle=True)
+
+        model = ChessEvaluatorMLP().to(device)
+
+    num_batches = -(-len(y_train_t) // config.BATCH_SIZE)
     criterion = nn.MSELoss()
     optimizer = optim.Adam(model.parameters(), lr=config.LEARNING_RATE)
     scheduler = optim.lr_scheduler.StepLR(optimizer, step_size=10, gamma=0.5)
@@ -52,19 +98,19 @@ def train():
     for epoch in range(config.EPOCHS):
         model.train()
         total = 0.0
-        for xb, yb in tqdm(train_loader, desc=f"Epoch {epoch+1}/{config.EPOCHS}"):
-            xb, yb = xb.to(device), yb.to(device)
+        for inputs, yb in tqdm(train_loader(), total=num_batches, desc=f"Epoch {epoch+1}/{config.EPOCHS}"):
+            inputs, yb = tuple(t.to(device) for t in inputs), yb.to(device)
             optimizer.zero_grad()
-            preds = model(xb)
+            preds = model(*inputs)
             loss = criterion(preds, yb)
             loss.backward()
             optimizer.step()
             total += loss.item()
-        train_loss = total / len(train_loader)
+        train_loss = total / num_batches
 
         model.eval()
         with torch.no_grad():
-            val_preds = model(X_val_t.to(device))
+            val_preds = model(*(t.to(device) for t in val_inputs))
             val_loss = criterion(val_preds, y_val_t.to(device)).item()
 
         print(f"Epoch {epoch+1}: train={train_loss:.4f} val={val_loss:.4f}")